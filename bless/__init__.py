@@ -1,56 +1,75 @@
 # type: ignore
-import sys
+import sys as _sys
+import importlib as _importlib
 
-if sys.platform == 'darwin':
+from typing import Any as _Any, Dict as _Dict, Tuple as _Tuple
 
-    # Server
-    from bless.backends.corebluetooth.server import (  # noqa: F401
-            BlessServerCoreBluetooth as BlessServer
-            )
+from bless.backends.characteristic import (  # noqa: F401
+        GattCharacteristicsFlags,
+        GATTAttributePermissions
+        )
 
-    # Characteristic Classes
-    from bless.backends.corebluetooth.characteristic import (  # noqa: F401
-            BlessGATTCharacteristicCoreBluetooth
-            as BlessGATTCharacteristic
-            )
-elif sys.platform == 'linux':
+# The platform backends pull in pyobjc, pythonnet or twisted, so they are only
+# imported once one of their classes is first accessed
+_BACKENDS: _Dict[str, _Dict[str, _Tuple[str, str]]] = {
+        'darwin': {
+            'BlessServer': (
+                'bless.backends.corebluetooth.server',
+                'BlessServerCoreBluetooth'
+                ),
+            'BlessGATTCharacteristic': (
+                'bless.backends.corebluetooth.characteristic',
+                'BlessGATTCharacteristicCoreBluetooth'
+                )
+            },
+        'linux': {
+            'BlessServer': (
+                'bless.backends.bluezdbus.server',
+                'BlessServerBlueZDBus'
+                )
+            },
+        'win32': {
+            'BlessServer': (
+                'bless.backends.dotnet.server',
+                'BlessServerDotNet'
+                ),
+            'BlessGATTCharacteristic': (
+                'bless.backends.dotnet.characteristic',
+                'BlessGATTCharacteristicDotNet'
+                )
+            }
+        }
 
-    # Server
-    from bless.backends.bluezdbus.server import (  # noqa: F401
-            BlessServerBlueZDBus as BlessServer
-            )
+_LAZY: _Dict[str, _Tuple[str, str]] = _BACKENDS.get(_sys.platform, {})
 
-elif sys.platform == 'win32':
 
-    # Server
-    from bless.backends.dotnet.server import (  # noqa: F401
-            BlessServerDotNet as BlessServer
-    )
+# Star imports skip names that are only resolved by __getattr__, so list the
+# backend classes available on this platform explicitly
+__all__ = list(_LAZY) + [
+        'GattCharacteristicsFlags',
+        'GATTAttributePermissions',
+        'check_test'
+        ]
 
-    # Characteristic Classes
-    from bless.backends.dotnet.characteristic import (  # noqa: F401
-            BlessGATTCharacteristicDotNet
-            as BlessGATTCharacteristic
-    )
 
-elif sys.platform == 'win32':
+def __getattr__(name: str) -> _Any:
+    """
+    Import the platform backend class for name on first access
+    """
+    if name not in _LAZY:
+        raise AttributeError(
+                "module {!r} has no attribute {!r}".format(__name__, name)
+                )
+    module_name, attr = _LAZY[name]
+    obj: _Any = getattr(_importlib.import_module(module_name), attr)
+    globals()[name] = obj
+    return obj
 
-    # Server
-    from bless.backends.dotnet.server import (
-            BlessServerDotNet as BlessServer
-    )
-    BlessServer
-    # Characteristic Classes
-    from bless.backends.dotnet.characteristic import (  # noqa: F401
-            BlessGATTCharacteristicDotNet
-            as BlessGATTCharacteristic
-    )
 
-# type: ignore
-from bless.backends.characteristic import (  # noqa: E402 F401
-        GattCharacteristicsFlags,
-        GATTAttributePermissions
-        )
+# Module level __getattr__ is only supported from python 3.7
+if _sys.version_info < (3, 7):
+    for _name in _LAZY:
+        __getattr__(_name)
 
 
 def check_test() -> bool:
@@ -5,6 +5,8 @@ from typing import List, Dict
 from txdbus.objects import DBusObject, DBusProperty, dbusMethod
 from txdbus.interface import DBusInterface, Method, Property
 
+LE_ADVERTISING_MANAGER_INTERFACE: str = "org.bluez.LEAdvertisingManager1"
+
 
 class Type(Enum):
     BROADCAST = "broadcast"
@@ -2,12 +2,14 @@ import asyncio
 
 import bleak.backends.bluezdbus.defs as defs
 
-from typing import List, Any, Callable, Optional
+from typing import List, Dict, Any, Optional
 
 from txdbus import client
 from txdbus.objects import DBusObject, RemoteDBusObject
 
+from bless.backends.server import BaseBlessServer
 from bless.backends.bluezdbus.advertisement import (
+        LE_ADVERTISING_MANAGER_INTERFACE,
         Type,
         BlueZLEAdvertisement
         )
@@ -28,7 +30,8 @@ class BlueZGattApplication(DBusObject):
             name: str,
             destination: str,
             bus: client,
-            loop: asyncio.AbstractEventLoop
+            loop: asyncio.AbstractEventLoop,
+            server: BaseBlessServer
             ):
         """
         Initialize a new GattApplication1
@@ -43,30 +46,59 @@ class BlueZGattApplication(DBusObject):
             The txdbus connection
         loop : asyncio.AbstractEventLoop
             The loop to use
+        server : BaseBlessServer
+            The server that handles read and write requests on the
+            application's characteristics
         """
         self.path: str = "/"
         self.name: str = name
         self.destination: str = destination
         self.bus: client = bus
         self.loop: asyncio.AbstractEventLoop = loop
+        self.server: BaseBlessServer = server
 
         self.base_path: str = "/org/bluez/" + self.name
         self.advertisements: List[BlueZLEAdvertisement] = []
         self.services: List[BlueZGattService] = []
-
-        self.Read: Optional[Callable[[BlueZGattCharacteristic], bytearray]] = (
-                None
-                )
-        self.Write: Optional[
-                Callable[[BlueZGattCharacteristic, bytearray], None]
-                ] = None
-        self.StartNotify: Optional[Callable[[None], None]] = None
-        self.StopNotify: Optional[Callable[[None], None]] = None
+        self.services_by_uuid: Dict[str, BlueZGattService] = {}
 
         self.subscribed_characteristics: List[str] = []
 
+        self.exported: bool = False
+        self._bus_name_request: Optional[asyncio.Future] = None
+
         super(BlueZGattApplication, self).__init__(self.path)
 
+    async def request_bus_name(self):
+        """
+        Request ownership of the destination bus name. The name is held for
+        the lifetime of the connection, so only the first call goes out over
+        DBus
+        """
+        if self._bus_name_request is None:
+            self._bus_name_request = self.bus.requestBusName(
+                    self.destination
+                    ).asFuture(self.loop)
+        try:
+            await self._bus_name_request
+        except Exception:
+            self._bus_name_request = None
+            raise
+
+    async def export(self):
+        """
+        Make the application, along with every service and characteristic
+        added so far, available on the bus. Anything added afterwards is
+        exported as it is added
+        """
+        self.bus.exportObject(self)
+        for service in self.services:
+            self.bus.exportObject(service)
+            for characteristic in service.characteristics:
+                self.bus.exportObject(characteristic)
+        await self.request_bus_name()
+        self.exported = True
+
     async def add_service(self, uuid: str) -> BlueZGattService:  # noqa: F821
         """
         Add a service to the application
@@ -89,8 +121,11 @@ class BlueZGattApplication(DBusObject):
                 uuid, primary, index, self
                 )
         self.services.append(service)
-        self.bus.exportObject(service)
-        await self.bus.requestBusName(self.destination).asFuture(self.loop)
+        self.services_by_uuid[uuid] = service
+
+        # Before export, the service goes out with the rest of the tree
+        if self.exported:
+            self.bus.exportObject(service)
         return service
 
     async def add_characteristic(
@@ -121,11 +156,7 @@ class BlueZGattApplication(DBusObject):
         BlueZGattCharacteristic
             The characteristic object
         """
-        service: BlueZGattService = next(iter([
-            x
-            for x in self.services
-            if x.uuid == service_uuid
-            ]))
+        service: BlueZGattService = self.services_by_uuid[service_uuid]
         index: int = len(service.characteristics) + 1
         characteristic: BlueZGattCharacteristic = BlueZGattCharacteristic(
                 uuid, flags, index, service
@@ -133,8 +164,11 @@ class BlueZGattApplication(DBusObject):
         characteristic.value = value
 
         service.characteristics.append(characteristic)
-        self.bus.exportObject(characteristic)
-        await self.bus.requestBusName(self.destination).asFuture(self.loop)
+        service.characteristics_by_uuid[uuid] = characteristic
+
+        # Before export, the characteristic goes out with the rest of the tree
+        if self.exported:
+            self.bus.exportObject(characteristic)
 
         return characteristic
 
@@ -187,7 +221,7 @@ class BlueZGattApplication(DBusObject):
             advertisement.service_uuids.append(service.uuid)
 
         self.bus.exportObject(advertisement)
-        await self.bus.requestBusName(self.destination).asFuture(self.loop)
+        await self.request_bus_name()
 
         await adapter.callRemote(
                 "RegisterAdvertisement",
@@ -211,7 +245,7 @@ class BlueZGattApplication(DBusObject):
         """
         instances: int = await adapter.callRemote(
                 "Get",
-                "org.bluez.LEAdvertisingManager1",
+                LE_ADVERTISING_MANAGER_INTERFACE,
                 "ActiveInstances",
                 interface=defs.PROPERTIES_INTERFACE,
                 ).asFuture(self.loop)
@@ -2,7 +2,7 @@ import bleak.backends.bluezdbus.defs as defs
 
 from enum import Enum
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from txdbus.objects import DBusObject, DBusProperty, dbusMethod
 from txdbus.interface import DBusInterface, Method, Property
@@ -12,6 +12,9 @@ from bleak.backends.bluezdbus.characteristic import (
         )
 from bless.backends.characteristic import GattCharacteristicsFlags
 
+# Flags.from_bless results, keyed by the combined integer flag value
+_FLAGS_CACHE: Dict[int, List['Flags']] = {}
+
 
 class Flags(Enum):
     BROADCAST = "broadcast"
@@ -46,21 +49,25 @@ class Flags(Enum):
         List[Flags]
             A list fo Flags for use in BlueZDBus
         """
-        result: List[Flags] = []
         # Apparently, the tests and examples are passing in integers, these
         # should be th Gatt Flags
-        flag_value: int = flags
-        for i, int_flag in enumerate(_GattCharacteristicsFlagsEnum.keys()):
-            included: bool = int_flag & flag_value > 0
-            if included:
-                flag_enum_val: str = _GattCharacteristicsFlagsEnum[int_flag]
-                flag: Flags = next(iter([
-                    Flags.__members__[x] for x in list(Flags.__members__)
-                    if Flags.__members__[x].value == flag_enum_val
-                    ]))
-                result.append(flag)
-
-        return result
+        flag_value: int = (
+                flags.value if isinstance(flags, GattCharacteristicsFlags)
+                else flags
+                )
+        result: Optional[List[Flags]] = _FLAGS_CACHE.get(flag_value)
+        if result is None:
+            result = []
+            for int_flag in _GattCharacteristicsFlagsEnum.keys():
+                included: bool = int_flag & flag_value > 0
+                if included:
+                    flag_enum_val: str = _GattCharacteristicsFlagsEnum[
+                            int_flag
+                            ]
+                    result.append(Flags(flag_enum_val))
+            _FLAGS_CACHE[flag_value] = result
+
+        return result[:]
 
 
 class BlueZGattCharacteristic(DBusObject):
@@ -129,7 +136,7 @@ class BlueZGattCharacteristic(DBusObject):
     def ReadValue(self, options: Dict) -> bytearray:  # noqa: N802
         """
         Read the value of the characteristic.
-        This is to be fully implemented at the application level
+        This is handed off to the server that owns the application
 
         Parameters
         ----------
@@ -141,16 +148,15 @@ class BlueZGattCharacteristic(DBusObject):
         bytearray
             The bytearray that is the value of the characteristic
         """
-        f = self._service.app.Read
-        if f is None:
-            raise NotImplementedError()
-        return f(self)
+        return self._service.app.server.read_request(
+                self.uuid, self._service.uuid
+                )
 
     @dbusMethod(interface_name, "WriteValue")
     def WriteValue(self, value: bytearray, options: Dict):  # noqa: N802
         """
         Write a value to the characteristic
-        This is to be fully implemented at the application level
+        This is handed off to the server that owns the application
 
         Parameters
         ----------
@@ -159,20 +165,15 @@ class BlueZGattCharacteristic(DBusObject):
         options : Dict
             Some options for you to select from
         """
-        f = self._service.app.Write
-        if f is None:
-            raise NotImplementedError()
-        f(self, value)
+        self._service.app.server.write_request(
+                self.uuid, value, self._service.uuid
+                )
 
     @dbusMethod(interface_name, "StartNotify")
     def StartNotify(self):  # noqa: N802
         """
         Begin a subscription to the characteristic
         """
-        f = self._service.app.StartNotify
-        if f is None:
-            raise NotImplementedError()
-        f(self)
         self._service.app.subscribed_characteristics.append(self.uuid)
 
     @dbusMethod(interface_name, "StopNotify")
@@ -180,8 +181,4 @@ class BlueZGattCharacteristic(DBusObject):
         """
         Stop a subscription to the characteristic
         """
-        f = self._service.app.StopNotify
-        if f is None:
-            raise NotImplementedError()
-        f(self)
         self._service.app.subscribed_characteristics.remove(self.uuid)
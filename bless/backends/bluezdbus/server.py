@@ -2,11 +2,13 @@ import asyncio
 
 import bleak.backends.bluezdbus.defs as defs
 
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable
 
 from asyncio import AbstractEventLoop
+from functools import lru_cache
 from twisted.internet.asyncioreactor import AsyncioSelectorReactor
 from txdbus import client
+from txdbus.error import RemoteError
 from txdbus.objects import RemoteDBusObject
 
 from bleak.backends.bluezdbus.service import BleakGATTServiceBlueZDBus
@@ -15,7 +17,14 @@ from bleak.backends.bluezdbus.characteristic import (
         )
 
 from bless.backends.server import BaseBlessServer
-from bless.backends.bluezdbus.utils import get_adapter
+from bless.backends.bluezdbus.utils import (
+        get_adapter,
+        get_reactor,
+        normalize_uuid
+        )
+from bless.backends.bluezdbus.advertisement import (
+        LE_ADVERTISING_MANAGER_INTERFACE
+        )
 from bless.backends.bluezdbus.application import BlueZGattApplication
 from bless.backends.bluezdbus.service import BlueZGattService
 from bless.backends.bluezdbus.characteristic import (
@@ -26,6 +35,46 @@ from bless.backends.bluezdbus.characteristic import (
 from bless.backends.characteristic import (
         GattCharacteristicsFlags
         )
+from bless.exceptions import BlessError
+
+
+@lru_cache(maxsize=64)
+def _characteristic_dict_builder(
+        properties: GattCharacteristicsFlags,
+        service_path: str
+        ) -> Callable[[str, bytes], Dict]:
+    """
+    Create a function that builds the Bleak property dictionary for
+    characteristics that share the same flags and service, so that the flag
+    strings are only worked out once per combination
+
+    Parameters
+    ----------
+    properties : GattCharacteristicsFlags
+        GATT Characteristic Flags that define the characteristic
+    service_path : str
+        The DBus path of the service the characteristic belongs to
+
+    Returns
+    -------
+    Callable[[str, bytes], Dict]
+        A function that takes the characteristic UUID and value and returns
+        its property dictionary
+    """
+    template: Dict = {
+            "Service": service_path,
+            "Flags": [flag.value for flag in Flags.from_bless(properties)],
+            "Notifying": False,
+            }
+
+    def build(uuid: str, value: bytes) -> Dict:
+        dict_obj: Dict = template.copy()
+        dict_obj["Flags"] = template["Flags"][:]
+        dict_obj["UUID"] = uuid
+        dict_obj["Value"] = bytes(value)
+        return dict_obj
+
+    return build
 
 
 class BlessServerBlueZDBus(BaseBlessServer):
@@ -42,33 +91,64 @@ class BlessServerBlueZDBus(BaseBlessServer):
     def __init__(self, name: str, loop: AbstractEventLoop = None, **kwargs):
         super(BlessServerBlueZDBus, self).__init__(loop=loop, **kwargs)
         self.name: str = name
-        self.reactor: AsyncioSelectorReactor = AsyncioSelectorReactor(loop)
+        self.reactor: AsyncioSelectorReactor = get_reactor(self.loop)
 
+        # Services stay under the UUID they were added with, as on the other
+        # backends, while lookups go through the normalized index
         self.services: Dict[str, BleakGATTServiceBlueZDBus] = {}
-
+        self._services: Dict[str, BleakGATTServiceBlueZDBus] = {}
+        # Characteristics are indexed per service, with the first one added
+        # answering lookups made without a service
+        self._characteristics: Dict[
+                str, BleakGATTCharacteristicBlueZDBus
+                ] = {}
+        self._service_characteristics: Dict[
+                str, Dict[str, BleakGATTCharacteristicBlueZDBus]
+                ] = {}
+
+        self._advertising: bool = False
+        self._adapter_match: Optional[int] = None
         self.setup_task: asyncio.Task = self.loop.create_task(self.setup())
 
     async def setup(self):
         """
         Asyncronous side of init
         """
+        # Each server keeps its own connection, as BlueZ identifies a GATT
+        # application by the sender and path that registered it
         self.bus: client = await client.connect(
                 self.reactor, "system"
                 ).asFuture(self.loop)
 
         gatt_name: str = self.name.replace(" ", "")
         self.app: BlueZGattApplication = BlueZGattApplication(
-                gatt_name, "org.bluez."+gatt_name, self.bus, self.loop
+                gatt_name, "org.bluez."+gatt_name, self.bus, self.loop, self
                 )
 
-        self.app.Read = self.read
-        self.app.Write = self.write
+        self.adapter: RemoteDBusObject = await get_adapter(self.bus, self.loop)
+
+        # An adapter without an advertising manager cannot be advertising
+        try:
+            self._advertising = await self.app.is_advertising(self.adapter)
+        except RemoteError:
+            self._advertising = False
 
-        # We don't need to define these
-        self.app.StartNotify = lambda x: None
-        self.app.StopNotify = lambda x: None
+    def _on_adapter_properties_changed(self, message: Any):
+        """
+        Update the cached advertising state when the adapter's advertising
+        manager reports a change in its active instances
 
-        self.adapter: RemoteDBusObject = await get_adapter(self.bus, self.loop)
+        Parameters
+        ----------
+        message : Any
+            The PropertiesChanged signal message
+        """
+        interface, changed, invalidated = message.body
+        if (
+                interface == LE_ADVERTISING_MANAGER_INTERFACE and
+                "ActiveInstances" in changed
+                ):
+            self._advertising = changed["ActiveInstances"] > 0
 
     async def start(self, **kwargs) -> bool:
         """
@@ -82,14 +162,24 @@ class BlessServerBlueZDBus(BaseBlessServer):
         await self.setup_task
 
         # Make our app available
-        self.bus.exportObject(self.app)
-        await self.bus.requestBusName(self.app.destination).asFuture(self.loop)
+        await self.app.export()
 
         # Register
         await self.app.register(self.adapter)
 
+        # Track the advertising state from the adapter's signals rather than
+        # querying it on every call to is_advertising
+        if self._adapter_match is None:
+            self._adapter_match = await self.bus.addMatch(
+                    self._on_adapter_properties_changed,
+                    interface=defs.PROPERTIES_INTERFACE,
+                    member="PropertiesChanged",
+                    path=self.adapter.objectPath
+                    ).asFuture(self.loop)
+
         # advertise
         await self.app.start_advertising(self.adapter)
+        self._advertising = await self.app.is_advertising(self.adapter)
 
         return True
 
@@ -104,6 +194,11 @@ class BlessServerBlueZDBus(BaseBlessServer):
         """
         # Stop Advertising
         await self.app.stop_advertising(self.adapter)
+        self._advertising = await self.app.is_advertising(self.adapter)
+
+        if self._adapter_match is not None:
+            await self.bus.delMatch(self._adapter_match).asFuture(self.loop)
+            self._adapter_match = None
 
         # Unregister
         await self.app.unregister(self.adapter)
@@ -131,7 +226,7 @@ class BlessServerBlueZDBus(BaseBlessServer):
             True if the server is advertising
         """
         await self.setup_task
-        return await self.app.is_advertising(self.adapter)
+        return self._advertising
 
     async def add_new_service(self, uuid: str):
         """
@@ -143,21 +238,23 @@ class BlessServerBlueZDBus(BaseBlessServer):
             The UUID for the service to add
         """
         await self.setup_task
-        gatt_service: BlueZGattService = await self.app.add_service(uuid)
-        dbus_obj: RemoteDBusObject = await self.bus.getRemoteObject(
-                self.app.destination,
-                gatt_service.path
-                ).asFuture(self.loop)
-        dict_obj: Dict = await dbus_obj.callRemote(
-                "GetAll",
-                defs.GATT_SERVICE_INTERFACE,
-                interface=defs.PROPERTIES_INTERFACE
-                ).asFuture(self.loop)
+        gatt_service: BlueZGattService = await self.app.add_service(
+                normalize_uuid(uuid)
+                )
+
+        # We already hold every property of the service locally, so there is
+        # no need to GetAll them back over DBus
+        dict_obj: Dict = {
+                "UUID": gatt_service.uuid,
+                "Primary": gatt_service.primary,
+                }
         service: BleakGATTServiceBlueZDBus = BleakGATTServiceBlueZDBus(
                 dict_obj,
                 gatt_service.path
                 )
         self.services[uuid] = service
+        self._services[gatt_service.uuid] = service
+        self._service_characteristics[gatt_service.uuid] = {}
 
     async def add_new_characteristic(
             self,
@@ -187,6 +284,8 @@ class BlessServerBlueZDBus(BaseBlessServer):
             characteristic
         """
         await self.setup_task
+        service_uuid = normalize_uuid(service_uuid)
+        char_uuid = normalize_uuid(char_uuid)
         flags: List[Flags] = Flags.from_bless(properties)
 
         # DBus can't handle None values
@@ -197,15 +296,9 @@ class BlessServerBlueZDBus(BaseBlessServer):
         gatt_char: BlueZGattCharacteristic = await self.app.add_characteristic(
                 service_uuid, char_uuid, value, flags
                 )
-        dbus_obj: RemoteDBusObject = await self.bus.getRemoteObject(
-                self.app.destination,
-                gatt_char.path
-                ).asFuture(self.loop)
-        dict_obj: Dict = await dbus_obj.callRemote(
-                "GetAll",
-                defs.GATT_CHARACTERISTIC_INTERFACE,
-                interface=defs.PROPERTIES_INTERFACE
-                ).asFuture(self.loop)
+        dict_obj: Dict = _characteristic_dict_builder(
+                properties, gatt_char.service
+                )(gatt_char.uuid, gatt_char.value)
 
         # Create a Bleak Characteristic
         char: BleakGATTCharacteristicBlueZDBus = (
@@ -217,76 +310,156 @@ class BlessServerBlueZDBus(BaseBlessServer):
                 )
 
         # Add it to the service
-        self.services[service_uuid].add_characteristic(char)
+        self._services[service_uuid].add_characteristic(char)
+        self._service_characteristics[service_uuid][char_uuid] = char
+        self._characteristics.setdefault(char_uuid, char)
 
-    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+    def get_characteristic(
+            self,
+            uuid: str,
+            service_uuid: Optional[str] = None
+            ) -> Optional[BleakGATTCharacteristicBlueZDBus]:
         """
-        Update the characteristic value. This is different than using
-        characteristic.set_value. This method ensures that subscribed devices
-        receive notifications, assuming the characteristic in question is
-        notifyable
+        Retrieves the characteristic whose UUID matches the string given.
+        Read and write requests coming in over DBus already carry the
+        normalized UUIDs, so they are found without converting them again
 
         Parameters
         ----------
-        service_uuid : str
-            The string representation of the UUID for the service associated
-            with the characteristic whose value is to be updated
-        char_uuid : str
-            The string representation of the UUID for the characteristic whose
-            value is to be updated
+        uuid : str
+            The string representation of the UUID for the characteristic to
+            retrieve
+        service_uuid : Optional[str]
+            The string representation of the UUID for the service the
+            characteristic belongs to. If None, the first characteristic
+            added with this UUID is returned
 
         Returns
         -------
-        bool
-            Whether the characteristic value was successfully updated
+        Optional[BleakGATTCharacteristicBlueZDBus]
+            The characteristic object, or None if there is no such
+            characteristic
         """
-        bless_service: BleakGATTServiceBlueZDBus = self.services[service_uuid]
-        bless_char: BleakGATTCharacteristicBlueZDBus = next(iter([
-            char for char in bless_service.characteristics
-            if char.uuid == char_uuid
-            ]))
-        cur_value: Any = bless_char.value
+        characteristics: Dict[str, BleakGATTCharacteristicBlueZDBus] = (
+                self._characteristics
+                )
+        if service_uuid is not None:
+            characteristics = self._service_characteristics.get(
+                    service_uuid
+                    ) or self._service_characteristics.get(
+                    normalize_uuid(service_uuid), {}
+                    )
 
-        service: BlueZGattService = next(iter([
-            service for service in self.app.services
-            if service.uuid == service_uuid
-            ]))
-        characteristic: BlueZGattCharacteristic = next(iter([
-            char for char in service.characteristics
-            if char.uuid == char_uuid
-            ]))
-        characteristic.value = cur_value
+        characteristic: Optional[BleakGATTCharacteristicBlueZDBus] = (
+                characteristics.get(uuid)
+                )
+        if characteristic is None:
+            characteristic = characteristics.get(normalize_uuid(uuid))
+        return characteristic
 
-    def read(self, char: BlueZGattCharacteristic) -> bytearray:
+    def read_request(
+            self,
+            uuid: str,
+            service_uuid: Optional[str] = None
+            ) -> bytearray:
         """
-        Read request.
-        This re-routes the the request incomming on the dbus to the server to
-        be re-routed to the user defined handler
+        Hand an incoming read request off to the user-defined
+        read_request_func
 
         Parameters
         ----------
-        char : BlueZGattCharacteristic
-            The characteristic passed from the app
+        uuid : str
+            The string representation of the UUID for the characteristic whose
+            value is to be read
+        service_uuid : Optional[str]
+            The string representation of the UUID for the service the
+            characteristic belongs to
 
         Returns
         -------
         bytearray
-            The value of the characteristic
+            A bytearray value that represents the value for the characteristic
+            requested
         """
-        return self.read_request(char.uuid)
+        characteristic: Optional[BleakGATTCharacteristicBlueZDBus] = (
+                self.get_characteristic(uuid, service_uuid)
+                )
 
-    def write(self, char: BlueZGattCharacteristic, value: bytearray):
+        if not characteristic:
+            raise BlessError("Invalid characteristic: {}".format(uuid))
+
+        return self.read_request_func(characteristic)
+
+    def write_request(
+            self,
+            uuid: str,
+            value: Any,
+            service_uuid: Optional[str] = None
+            ):
         """
-        Write request.
-        This function re-routes the write request sent from the
-        BlueZGattApplication to the server function for re-route to the user
-        defined handler
+        Hand an incoming write request off to the user-defined
+        write_request_func
+
+        Parameters
+        ----------
+        uuid : str
+            The string representation of the UUID for the characteristic whose
+            value is to be written
+        value : Any
+            The value to write
+        service_uuid : Optional[str]
+            The string representation of the UUID for the service the
+            characteristic belongs to
+        """
+        characteristic: Optional[BleakGATTCharacteristicBlueZDBus] = (
+                self.get_characteristic(uuid, service_uuid)
+                )
+
+        self.write_request_func(characteristic, value)
+
+    def update_value(self, service_uuid: str, char_uuid: str) -> bool:
+        """
+        Update the characteristic value. This is different than using
+        characteristic.set_value. This method ensures that subscribed devices
+        receive notifications, assuming the characteristic in question is
+        notifyable
 
         Parameters
         ----------
-        char : BlueZGattCharacteristic
-            The characteristic object involved in the request
-        value : bytearray
-            The value being requested to set
+        service_uuid : str
+            The string representation of the UUID for the service associated
+            with the characteristic whose value is to be updated
+        char_uuid : str
+            The string representation of the UUID for the characteristic whose
+            value is to be updated
+
+        Returns
+        -------
+        bool
+            Whether the characteristic value was successfully updated
         """
-        return self.write_request(char.uuid, value)
+        service_uuid = normalize_uuid(service_uuid)
+        char_uuid = normalize_uuid(char_uuid)
+
+        bless_char: Optional[BleakGATTCharacteristicBlueZDBus] = (
+                self._service_characteristics.get(service_uuid, {}).get(
+                    char_uuid
+                    )
+                )
+        if bless_char is None:
+            return False
+        cur_value: Any = bless_char.value
+
+        service: Optional[BlueZGattService] = self.app.services_by_uuid.get(
+                service_uuid
+                )
+        if service is None:
+            return False
+        characteristic: Optional[BlueZGattCharacteristic] = (
+                service.characteristics_by_uuid.get(char_uuid)
+                )
+        if characteristic is None:
+            return False
+        characteristic.value = cur_value
+
+        return True
@@ -2,7 +2,7 @@ import asyncio
 
 import bleak.backends.bluezdbus.defs as defs
 
-from typing import List
+from typing import List, Dict
 
 from txdbus import client
 from txdbus.objects import DBusObject, DBusProperty
@@ -63,4 +63,5 @@ class BlueZGattService(DBusObject):
         self.app: 'BlueZGattApplication' = app  # noqa: F821
 
         self.characteristics: List[BlueZGattCharacteristic] = []
+        self.characteristics_by_uuid: Dict[str, BlueZGattCharacteristic] = {}
         super(BlueZGattService, self).__init__(self.path)
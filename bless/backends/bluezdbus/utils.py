@@ -1,31 +1,84 @@
+import sys
 import asyncio
 
 import bleak.backends.bluezdbus.defs as defs
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
+from uuid import UUID
+
+from twisted.internet.asyncioreactor import AsyncioSelectorReactor
+from twisted.internet.defer import Deferred
 from txdbus import client
 from txdbus.objects import RemoteDBusObject
 
 
-async def find_adapter(
-        bus: client,
-        loop: asyncio.AbstractEventLoop
-        ) -> Optional[str]:
+def normalize_uuid(uuid: Union[str, UUID]) -> str:
     """
-    Returns the first object that the bluez service has that has a GattManager1
-    interface
+    Converts a UUID to the lower case string form used as a key throughout
+    the BlueZ backend. The result is interned so that every object and
+    dictionary holding the same UUID shares one string
+
+    Parameters
+    ----------
+    uuid : Union[str, UUID]
+        The UUID to normalize
+
+    Returns
+    -------
+    str
+        The lower case string representation of the UUID
     """
-    bluez_obj: RemoteDBusObject = await bus.getRemoteObject(
-            defs.BLUEZ_SERVICE,
-            "/"
-            ) .asFuture(loop)
+    if isinstance(uuid, UUID):
+        return sys.intern(str(uuid))
+    return sys.intern(uuid.lower())
 
-    om_objects: Dict = await bluez_obj.callRemote(
-            "GetManagedObjects",
-            interface=defs.OBJECT_MANAGER_INTERFACE
-            ).asFuture(loop)
 
+# Reactors, shared between all servers running on the same loop
+_REACTOR_CACHE: Dict[asyncio.AbstractEventLoop, AsyncioSelectorReactor] = {}
+
+
+def get_reactor(loop: asyncio.AbstractEventLoop) -> AsyncioSelectorReactor:
+    """
+    Gets the Twisted reactor that runs on the given loop, creating it the
+    first time it is requested
+
+    Parameters
+    ----------
+    loop : asyncio.AbstractEventLoop
+        The loop the reactor should run on
+
+    Returns
+    -------
+    AsyncioSelectorReactor
+        The reactor for the loop
+    """
+    if loop not in _REACTOR_CACHE:
+        # Forget the reactors of loops that have since been closed
+        for closed_loop in [x for x in _REACTOR_CACHE if x.is_closed()]:
+            del _REACTOR_CACHE[closed_loop]
+        _REACTOR_CACHE[loop] = AsyncioSelectorReactor(loop)
+    return _REACTOR_CACHE[loop]
+
+
+def _get_managed_objects(bus: client) -> Deferred:
+    """
+    Chains the lookup of the bluez root object and its GetManagedObjects call
+    within Twisted, so that only the final result is handed back to asyncio
+    """
+    return bus.getRemoteObject(defs.BLUEZ_SERVICE, "/").addCallback(
+            lambda bluez_obj: bluez_obj.callRemote(
+                "GetManagedObjects",
+                interface=defs.OBJECT_MANAGER_INTERFACE
+                )
+            )
+
+
+def _adapter_path(om_objects: Dict) -> Optional[str]:
+    """
+    Returns the path of the first managed object that has a GattManager1
+    interface
+    """
     for o, props in om_objects.items():
         if defs.GATT_MANAGER_INTERFACE in props.keys():
             return o
@@ -33,6 +86,19 @@ async def find_adapter(
     return None
 
 
+async def find_adapter(
+        bus: client,
+        loop: asyncio.AbstractEventLoop
+        ) -> Optional[str]:
+    """
+    Returns the first object that the bluez service has that has a GattManager1
+    interface
+    """
+    return await _get_managed_objects(bus).addCallback(
+            _adapter_path
+            ).asFuture(loop)
+
+
 async def get_adapter(
         bus: client,
         loop: asyncio.AbstractEventLoop
@@ -45,7 +111,8 @@ async def get_adapter(
     DBusObject
         The adapter object
     """
-    adapter_path: Optional[str] = await find_adapter(bus, loop)
-    adapter_obj: RemoteDBusObject = await bus.getRemoteObject(
-            defs.BLUEZ_SERVICE, adapter_path).asFuture(loop)
-    return adapter_obj
+    return await _get_managed_objects(bus).addCallback(
+            lambda om_objects: bus.getRemoteObject(
+                defs.BLUEZ_SERVICE, _adapter_path(om_objects)
+                )
+            ).asFuture(loop)
@@ -4,7 +4,7 @@ import logging
 
 
 from asyncio import AbstractEventLoop
-from typing import Any, Optional, Dict, Callable, List, Union
+from typing import Any, Optional, Dict, Callable, List, Union, Tuple
 from bleak.backends.service import BleakGATTService
 
 from bless.backends.characteristic import (
@@ -137,6 +137,28 @@ class BaseBlessServer(abc.ABC):
         """
         raise NotImplementedError()
 
+    async def add_characteristics(
+            self,
+            specs: List[Tuple[
+                str, str, GattCharacteristicsFlags, Optional[bytearray], int
+                ]]
+            ):
+        """
+        Add several characteristics to be associated with the server, in the
+        order given. If adding one of them fails, the exception is raised and
+        the remaining characteristics are not added, while those before it
+        remain on the server
+
+        Parameters
+        ----------
+        specs : List[Tuple[str, str, GattCharacteristicsFlags,
+                Optional[bytearray], int]]
+            The arguments for add_new_characteristic for each characteristic
+            to add
+        """
+        for spec in specs:
+            await self.add_new_characteristic(*spec)
+
     @abc.abstractmethod
     def update_value(self, service_uuid: str, char_uuid: str) -> bool:
         """
@@ -1,14 +1,14 @@
 import sys
 import uuid
+import random
 import pytest
 import asyncio
 import aioconsole
 
-import numpy as np
-
 if sys.platform.lower() != "linux":
     pytest.skip("Only for linux", allow_module_level=True)
 
+from types import SimpleNamespace  # noqa: E402
 from typing import List  # noqa: E402
 
 from txdbus import client  # noqa: E402
@@ -17,7 +17,6 @@ from txdbus.objects import RemoteDBusObject  # noqa: E402
 from bless.backends.bluezdbus.characteristic import Flags  # noqa: E402
 from bless.backends.bluezdbus.utils import get_adapter  # noqa: E402
 from bless.backends.bluezdbus.application import BlueZGattApplication  # noqa: E402 E501
-from bless.backends.bluezdbus.characteristic import BlueZGattCharacteristic  # noqa: E402 E501
 
 from twisted.internet.asyncioreactor import AsyncioSelectorReactor  # noqa: E402 E501
 
@@ -40,18 +39,18 @@ class TestBlueZGattApplication:
     @pytest.mark.asyncio
     async def test_init(self):
 
-        def read(char: BlueZGattCharacteristic):
+        def read(char_uuid: str) -> bytearray:
             return self.val
 
-        def write(char: BlueZGattCharacteristic, value: bytearray):
-            char.value = value
+        def write(char_uuid: str, value: bytearray):
+            app.services[0].characteristics_by_uuid[char_uuid].value = value
             self.val = value
 
-        def notify(char: BlueZGattCharacteristic):
-            return
-
-        def stop_notify(char: BlueZGattCharacteristic):
-            return
+        # Stands in for the server that handles requests on the app
+        server: SimpleNamespace = SimpleNamespace(
+                read_request=read,
+                write_request=write
+                )
 
         loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
@@ -60,12 +59,8 @@ class TestBlueZGattApplication:
 
         # Create the app
         app: BlueZGattApplication = BlueZGattApplication(
-                "ble", "org.bluez.testapp", bus, loop
+                "ble", "org.bluez.testapp", bus, loop, server
                 )
-        app.Read = read
-        app.Write = write
-        app.StartNotify = notify
-        app.StopNotify = stop_notify
 
         # Add a service
         service_uuid: str = str(uuid.uuid4())
@@ -83,8 +78,7 @@ class TestBlueZGattApplication:
                 )
 
         # Validate the app
-        bus.exportObject(app)
-        await bus.requestBusName(app.destination).asFuture(loop)
+        await app.export()
 
         response = await bus.callRemote(
                 app.path,
@@ -139,11 +133,10 @@ class TestBlueZGattApplication:
         assert await app.is_connected() is True
 
         # Read test
-        rng: np.random._generator.Generator = np.random.default_rng()
-        hex_val: str = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val: str = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -153,17 +146,17 @@ class TestBlueZGattApplication:
         assert entered_value == hex_val
 
         # Write test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         print(f"Set the characteristic to the following: {hex_val}")
         await aioconsole.ainput("Press enter when ready...")
-        str_val: str = ''.join([hex(x)[2:] for x in self.val]).upper()
+        str_val: str = f"{int.from_bytes(self.val, 'big'):X}"
         assert str_val == hex_val
 
         # Notify test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -0,0 +1,28 @@
+import sys
+import pytest
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from typing import List  # noqa: E402
+
+from bless.backends.bluezdbus.characteristic import Flags  # noqa: E402
+from bless.backends.characteristic import GattCharacteristicsFlags  # noqa: E402 E501
+
+
+def test_from_bless():
+    properties: GattCharacteristicsFlags = (
+            GattCharacteristicsFlags.read |
+            GattCharacteristicsFlags.write |
+            GattCharacteristicsFlags.notify
+            )
+    expected: List[Flags] = [Flags.READ, Flags.WRITE, Flags.NOTIFY]
+
+    assert Flags.from_bless(properties) == expected
+    assert Flags.from_bless(properties.value) == expected
+
+    # Changing a returned list must not change later results
+    result: List[Flags] = Flags.from_bless(properties.value)
+    result.append(Flags.INDICATE)
+    assert Flags.from_bless(properties.value) == expected
+    assert Flags.from_bless(properties) == expected
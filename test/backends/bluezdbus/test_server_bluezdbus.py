@@ -0,0 +1,194 @@
+import sys
+import uuid
+import pytest
+import asyncio
+
+from types import SimpleNamespace
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from bless.backends.bluezdbus.server import BlessServerBlueZDBus  # noqa: E402
+from bless.backends.bluezdbus.application import BlueZGattApplication  # noqa: E402 E501
+from bless.backends.bluezdbus.advertisement import LE_ADVERTISING_MANAGER_INTERFACE  # noqa: E402 E501
+from bless.backends.characteristic import GattCharacteristicsFlags  # noqa: E402 E501
+
+
+def test_update_value_mixed_case():
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        server: BlessServerBlueZDBus = BlessServerBlueZDBus(
+                "Test Server", loop=loop
+                )
+
+        # Skip connecting to the system bus, nothing is exported before the
+        # server is started
+        server.setup_task.cancel()
+        server.setup_task = loop.create_future()
+        server.setup_task.set_result(None)
+        server.app = BlueZGattApplication(
+                "TestServer", "org.bluez.TestServer", None, loop, server
+                )
+
+        service_uuid: str = str(uuid.uuid4())
+        char_uuid: str = str(uuid.uuid4())
+        loop.run_until_complete(server.add_new_service(service_uuid.upper()))
+        loop.run_until_complete(server.add_new_characteristic(
+                service_uuid.upper(),
+                char_uuid.upper(),
+                GattCharacteristicsFlags.read.value,
+                None,
+                0
+                ))
+
+        assert service_uuid.upper() in server.services
+        bless_char = server.services[service_uuid.upper()].characteristics[0]
+        assert server.get_characteristic(char_uuid.upper()) is bless_char
+        assert server.get_characteristic(
+                server.app.services[0].characteristics[0].uuid
+                ) is bless_char
+        assert server.get_characteristic(str(uuid.uuid4())) is None
+        bless_char.value = b'\x01'
+
+        assert server.update_value(service_uuid.upper(), char_uuid) is True
+        assert (
+                server.app.services[0].characteristics[0].value == b'\x01'
+                )
+
+        assert server.update_value(service_uuid, str(uuid.uuid4())) is False
+        assert server.update_value(str(uuid.uuid4()), char_uuid) is False
+    finally:
+        loop.close()
+
+
+def test_duplicate_characteristic_uuid():
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        server: BlessServerBlueZDBus = BlessServerBlueZDBus(
+                "Test Server", loop=loop
+                )
+        server.setup_task.cancel()
+        server.setup_task = loop.create_future()
+        server.setup_task.set_result(None)
+        server.app = BlueZGattApplication(
+                "TestServer", "org.bluez.TestServer", None, loop, server
+                )
+        server.read_request_func = lambda characteristic: characteristic.value
+
+        written: list = []
+        server.write_request_func = (
+                lambda characteristic, value: written.append(
+                    (characteristic, value)
+                    )
+                )
+
+        service_uuids: list = [str(uuid.uuid4()), str(uuid.uuid4())]
+        char_uuid: str = str(uuid.uuid4())
+        for service_uuid in service_uuids:
+            loop.run_until_complete(server.add_new_service(service_uuid))
+            loop.run_until_complete(server.add_new_characteristic(
+                    service_uuid,
+                    char_uuid,
+                    GattCharacteristicsFlags.read.value,
+                    None,
+                    0
+                    ))
+
+        first = server.services[service_uuids[0]].characteristics[0]
+        second = server.services[service_uuids[1]].characteristics[0]
+        first.value = b'\x01'
+        second.value = b'\x02'
+
+        assert server.get_characteristic(char_uuid) is first
+        assert server.get_characteristic(
+                char_uuid.upper(), service_uuids[1].upper()
+                ) is second
+        assert server.get_characteristic(
+                char_uuid, str(uuid.uuid4())
+                ) is None
+
+        # Requests over DBus reach the characteristic of their own service
+        gatt_char = server.app.services[1].characteristics[0]
+        assert gatt_char.ReadValue({}) == b'\x02'
+        gatt_char.WriteValue(b'\x03', {})
+        assert written == [(second, b'\x03')]
+    finally:
+        loop.close()
+
+
+def test_add_characteristics_stops_at_failure():
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        server: BlessServerBlueZDBus = BlessServerBlueZDBus(
+                "Test Server", loop=loop
+                )
+        server.setup_task.cancel()
+        server.setup_task = loop.create_future()
+        server.setup_task.set_result(None)
+        server.app = BlueZGattApplication(
+                "TestServer", "org.bluez.TestServer", None, loop, server
+                )
+
+        service_uuid: str = str(uuid.uuid4())
+        char_uuids: list = [str(uuid.uuid4()) for i in range(3)]
+        flags: GattCharacteristicsFlags = GattCharacteristicsFlags.read.value
+        loop.run_until_complete(server.add_new_service(service_uuid))
+
+        # The second characteristic belongs to a service that was never added
+        with pytest.raises(KeyError):
+            loop.run_until_complete(server.add_characteristics([
+                (service_uuid, char_uuids[0], flags, None, 0),
+                (str(uuid.uuid4()), char_uuids[1], flags, None, 0),
+                (service_uuid, char_uuids[2], flags, None, 0)
+                ]))
+
+        assert [
+                char.uuid
+                for char in server.services[service_uuid].characteristics
+                ] == [char_uuids[0]]
+        assert [
+                char.uuid for char in server.app.services[0].characteristics
+                ] == [char_uuids[0]]
+        assert server.get_characteristic(char_uuids[1]) is None
+        assert server.get_characteristic(char_uuids[2]) is None
+    finally:
+        loop.close()
+
+
+def test_adapter_properties_changed():
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        server: BlessServerBlueZDBus = BlessServerBlueZDBus(
+                "Test Server", loop=loop
+                )
+        server.setup_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(server.setup_task)
+        assert server._advertising is False
+
+        server._on_adapter_properties_changed(SimpleNamespace(
+            body=(LE_ADVERTISING_MANAGER_INTERFACE, {"ActiveInstances": 1}, [])
+            ))
+        assert server._advertising is True
+
+        # Changes on other interfaces of the adapter are ignored
+        server._on_adapter_properties_changed(SimpleNamespace(
+            body=("org.bluez.Adapter1", {"ActiveInstances": 0}, [])
+            ))
+        assert server._advertising is True
+
+        server._on_adapter_properties_changed(SimpleNamespace(
+            body=(
+                LE_ADVERTISING_MANAGER_INTERFACE,
+                {"SupportedInstances": 4},
+                []
+                )
+            ))
+        assert server._advertising is True
+
+        server._on_adapter_properties_changed(SimpleNamespace(
+            body=(LE_ADVERTISING_MANAGER_INTERFACE, {"ActiveInstances": 0}, [])
+            ))
+        assert server._advertising is False
+    finally:
+        loop.close()
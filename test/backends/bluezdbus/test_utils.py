@@ -0,0 +1,39 @@
+import sys
+import uuid
+import pytest
+import asyncio
+
+if sys.platform.lower() != "linux":
+    pytest.skip("Only for linux", allow_module_level=True)
+
+from twisted.internet.asyncioreactor import AsyncioSelectorReactor  # noqa: E402 E501
+
+from bless.backends.bluezdbus.utils import (  # noqa: E402
+        _REACTOR_CACHE,
+        get_reactor,
+        normalize_uuid
+        )
+
+
+def test_normalize_uuid():
+    service_uuid: uuid.UUID = uuid.uuid4()
+    lower: str = str(service_uuid)
+
+    assert normalize_uuid(lower.upper()) == lower
+    assert normalize_uuid(service_uuid) == lower
+
+    # Both forms resolve to the same interned string
+    assert normalize_uuid(lower.upper()) is normalize_uuid(service_uuid)
+
+
+def test_get_reactor():
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    reactor: AsyncioSelectorReactor = get_reactor(loop)
+    assert get_reactor(loop) is reactor
+    loop.close()
+
+    # A closed loop is dropped once another loop asks for a reactor
+    other_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    get_reactor(other_loop)
+    assert loop not in _REACTOR_CACHE
+    other_loop.close()
@@ -1,12 +1,11 @@
 import sys
 import uuid
+import random
 import pytest
 import logging
 import asyncio
 import aioconsole
 
-import numpy as np
-
 from typing import Dict, Any, List, Optional
 
 if sys.platform.lower() != "darwin":
@@ -143,11 +142,10 @@ class TestPeripheralManagerDelegate:
         assert pmd.is_connected() is True
 
         # Read Test
-        rng: np.random._generator.Generator = np.random.default_rng()
-        hex_val: str = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val: str = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -156,17 +154,17 @@ class TestPeripheralManagerDelegate:
         assert entered_value == hex_val
 
         # Write test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         print(f"Set the characteristic to the following: {hex_val}")
         await aioconsole.ainput("Press enter when ready...")
-        str_val: str = ''.join([hex(x)[2:] for x in self.val]).upper()
+        str_val: str = f"{int.from_bytes(self.val, 'big'):X}"
         assert str_val == hex_val
 
         # Notify test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -1,10 +1,12 @@
 import sys
 import uuid
+import random
 import pytest
+import asyncio
+import logging
+import concurrent.futures
 import aioconsole
 
-import numpy as np
-
 if sys.platform.lower() != "win32":
     pytest.skip("Only for windows", allow_module_level=True)
 
@@ -12,16 +14,14 @@ from typing import List  # noqa: E402
 
 hardware_only = pytest.mark.skipif("os.environ.get('TEST_HARDWARE') is None")
 
-from bleak.backends.dotnet.utils import (  # noqa: E402
-        wrap_IAsyncOperation,
-        BleakDataWriter
-        )
+logger = logging.getLogger(__name__)
+
+from bleak.backends.dotnet.utils import wrap_IAsyncOperation  # noqa: E402
 
 from bless.backends.characteristic import (  # noqa: E402
         GattCharacteristicsFlags,
         GATTAttributePermissions
         )
-from bless.backends.dotnet.utils import sync_async_wrap  # noqa: E402
 
 from Windows.Foundation import (  # noqa: E402
         IAsyncOperation,
@@ -29,6 +29,7 @@ from Windows.Foundation import (  # noqa: E402
         )
 
 from Windows.Storage.Streams import DataReader, DataWriter  # noqa: E402
+from Windows.Security.Cryptography import CryptographicBuffer  # noqa: E402
 
 from Windows.Devices.Bluetooth.GenericAttributeProfile import (  # noqa: E402 F401 E501
     GattWriteOption,
@@ -47,6 +48,8 @@ from Windows.Devices.Bluetooth.GenericAttributeProfile import (  # noqa: E402 F4
 )
 
 from System import (  # noqa: E402
+    Array,
+    Byte,
     Guid,
     Object
 )
@@ -70,42 +73,72 @@ class TestServiceProvider:
     @pytest.mark.asyncio
     async def test_init(self):
 
-        def read(
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        async def read(
+                args: GattReadRequestedEventArgs,
+                deferral: Deferral
+                ):
+            try:
+                request: GattReadRequest = await wrap_IAsyncOperation(
+                        IAsyncOperation[GattReadRequest](
+                            args.GetRequestAsync()
+                            ),
+                        return_type=GattReadRequest
+                        )
+                writer: DataWriter = DataWriter()
+                writer.WriteBytes(self.val)
+                request.RespondWithValue(writer.DetachBuffer())
+            finally:
+                deferral.Complete()
+
+        async def write(
+                args: GattWriteRequestedEventArgs,
+                deferral: Deferral
+                ):
+            try:
+                request: GattWriteRequest = await wrap_IAsyncOperation(
+                        IAsyncOperation[GattWriteRequest](
+                            args.GetRequestAsync()
+                            ),
+                        return_type=GattWriteRequest
+                        )
+                reader: DataReader = DataReader.FromBuffer(request.Value)
+                n_bytes: int = reader.UnconsumedBufferLength
+                buf: Array = Array.CreateInstance(Byte, n_bytes)
+                reader.ReadBytes(buf)
+                self.val = bytearray(buf)
+
+                if request.Option == GattWriteOption.WriteWithResponse:
+                    request.Respond()
+            finally:
+                deferral.Complete()
+
+        def log_exception(future: concurrent.futures.Future):
+            if future.exception() is not None:
+                logger.error(
+                        "Request handler failed",
+                        exc_info=future.exception()
+                        )
+
+        # The deferral must be taken before the event handler returns, the
+        # request itself is then completed on the event loop so the thread
+        # delivering the event is released immediately
+        def on_read(
                 sender: GattLocalCharacteristic,
                 args: GattReadRequestedEventArgs
                 ):
-            deferral: Deferral = args.GetDeferral()
-            value = self.val
-            writer: DataWriter = DataWriter()
-            writer.WriteBytes(value)
-            request: GattReadRequest = sync_async_wrap(
-                GattReadRequest,
-                args.GetRequestAsync
-            )
-            request.RespondWithValue(writer.DetachBuffer())
-            deferral.Complete()
-
-        def write(
+            asyncio.run_coroutine_threadsafe(
+                    read(args, args.GetDeferral()), loop
+                    ).add_done_callback(log_exception)
+
+        def on_write(
                 sender: GattLocalCharacteristic,
                 args: GattWriteRequestedEventArgs
                 ):
-            deferral: Deferral = args.GetDeferral()
-            request: GattWriteRequest = sync_async_wrap(
-                    GattWriteRequest,
-                    args.GetRequestAsync
-                    )
-            reader: DataReader = DataReader.FromBuffer(request.Value)
-            n_bytes: int = reader.UnconsumedBufferLength
-            value: bytearray = bytearray()
-            for n in range(0, n_bytes):
-                next_byte: int = reader.ReadByte()
-                value.append(next_byte)
-            self.val = value
-
-            if request.Option == GattWriteOption.WriteWithResponse:
-                request.Respond()
-
-            deferral.Complete()
+            asyncio.run_coroutine_threadsafe(
+                    write(args, args.GetDeferral()), loop
+                    ).add_done_callback(log_exception)
 
         def subscribe(
                 sender: GattLocalCharacteristic,
@@ -161,8 +194,8 @@ class TestServiceProvider:
                     return_type=GattLocalCharacteristicResult)
                 )
         newChar: GattLocalCharacteristic = characteristic_result.Characteristic
-        newChar.ReadRequested += read
-        newChar.WriteRequested += write
+        newChar.ReadRequested += on_read
+        newChar.WriteRequested += on_write
         newChar.SubscribedClientsChanged += subscribe
 
         # Ensure we're not advertising
@@ -193,11 +226,10 @@ class TestServiceProvider:
         assert len(self._subscribed_clients) > 0
 
         # Read test
-        rng: np.random._generator.Generator = np.random.default_rng()
-        hex_val: str = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val: str = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -207,17 +239,17 @@ class TestServiceProvider:
         assert entered_value == hex_val
 
         # Write test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         print(f"Set the characteristic to the following: {hex_val}")
         await aioconsole.ainput("Press enter when ready...")
-        str_val: str = ''.join([hex(x)[2:] for x in self.val]).upper()
+        str_val: str = f"{int.from_bytes(self.val, 'big'):X}"
         assert str_val == hex_val
 
         # Notify test
-        hex_val = ''.join(rng.choice(self.hex_words, 2, replace=False))
+        hex_val = ''.join(random.sample(self.hex_words, 2))
         self.val = bytearray(
                 int(f"0x{hex_val}", 16).to_bytes(
-                    length=int(np.ceil(len(hex_val)/2)),
+                    length=(len(hex_val) + 1) // 2,
                     byteorder='big'
                     )
                 )
@@ -225,10 +257,9 @@ class TestServiceProvider:
         print("A new value will be sent")
         await aioconsole.ainput("Press enter to receive the new value...")
 
-        with BleakDataWriter(self.val) as writer:
-            newChar.NotifyValueAsync(
-                    writer.detach_buffer()
-                    )
+        newChar.NotifyValueAsync(
+                CryptographicBuffer.CreateFromByteArray(bytes(self.val))
+                )
 
         new_value: str = await aioconsole.ainput("Enter the New value: ")
         assert new_value == hex_val
@@ -1,11 +1,10 @@
 import sys
 import uuid
+import random
 import pytest
 import asyncio
 import aioconsole
 
-import numpy as np
-
 from typing import Optional, List
 
 from bless.backends.characteristic import BlessGATTCharacteristic
@@ -41,19 +40,18 @@ class TestBlessServer:
                 'CAFE', 'FADE', 'BAD',
                 'DAD', 'ACE', 'BED'
                 ]
-        rng: np.random._generator.Generator = np.random.default_rng()
-        return ''.join(rng.choice(hex_words, 2, replace=False))
+        return ''.join(random.sample(hex_words, 2))
 
     def hex_to_byte(self, hexstr: str) -> bytearray:
         return bytearray(
                 int(f"0x{hexstr}", 16).to_bytes(
-                    length=int(np.ceil(len(hexstr)/2)),
+                    length=(len(hexstr) + 1) // 2,
                     byteorder="big"
                     )
                 )
 
     def byte_to_hex(self, b: bytearray) -> str:
-        return ''.join([hex(x)[2:] for x in b]).upper()
+        return f"{int.from_bytes(b, 'big'):X}"
 
     @pytest.mark.asyncio
     async def test_server(self):
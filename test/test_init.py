@@ -1,5 +1,24 @@
+import sys
+import pytest
 import bless
 
 
 def test_check():
     assert bless.check_test()
+
+
+@pytest.mark.skipif(
+        sys.platform not in ['darwin', 'linux', 'win32'],
+        reason="No backend for this platform"
+        )
+def test_backend_exports():
+    assert bless.BlessServer is not None
+    assert 'BlessServer' in bless.__all__
+
+    namespace: dict = {}
+    exec("from bless import *", namespace)
+    assert namespace['BlessServer'] is bless.BlessServer
+    assert namespace['GattCharacteristicsFlags'] is (
+            bless.GattCharacteristicsFlags
+            )
+    assert 'sys' not in namespace